@@ -2,8 +2,6 @@
 
 from app.adapters.poi.mock import get_poi_detail as mock_get_poi_detail
 from app.adapters.poi.mock import search_poi as mock_search_poi
-from app.adapters.poi.real import get_poi_detail as real_get_poi_detail
-from app.adapters.poi.real import search_poi as real_search_poi
 
 __all__ = [
     "mock_search_poi",
@@ -12,3 +10,12 @@ __all__ = [
     "real_get_poi_detail",
 ]
 
+
+def __getattr__(name: str):
+    # Real adapters pull in the HTTP client stack; load them on first access only.
+    if name in {"real_get_poi_detail", "real_search_poi"}:
+        from app.adapters.poi import real
+
+        return getattr(real, name.removeprefix("real_"))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
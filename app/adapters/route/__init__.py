@@ -3,9 +3,6 @@
 from app.adapters.route.mock import estimate_distance as mock_estimate_distance
 from app.adapters.route.mock import estimate_route as mock_estimate_route
 from app.adapters.route.mock import estimate_travel_time as mock_estimate_travel_time
-from app.adapters.route.real import estimate_distance as real_estimate_distance
-from app.adapters.route.real import estimate_route as real_estimate_route
-from app.adapters.route.real import estimate_travel_time as real_estimate_travel_time
 
 __all__ = [
     "mock_estimate_distance",
@@ -16,3 +13,12 @@ __all__ = [
     "real_estimate_route",
 ]
 
+
+def __getattr__(name: str):
+    # Real adapters pull in the HTTP client stack; load them on first access only.
+    if name in {"real_estimate_distance", "real_estimate_travel_time", "real_estimate_route"}:
+        from app.adapters.route import real
+
+        return getattr(real, name.removeprefix("real_"))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
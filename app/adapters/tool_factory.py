@@ -6,11 +6,6 @@ import logging
 import os
 
 from app.adapters.fault_injection import wrap_tool_with_fault_injection
-from app.adapters.budget import mock as mock_budget
-from app.adapters.calendar import mock as mock_calendar
-from app.adapters.poi import mock as mock_poi
-from app.adapters.route import mock as mock_route
-from app.adapters.weather import mock as mock_weather
 from app.security.key_manager import get_key_manager
 from app.security.redact import redact_sensitive
 from app.shared.exceptions import ToolError
@@ -61,6 +56,8 @@ def get_poi_tool():
                 "Failed to load amap poi adapter, fallback to mock: %s",
                 redact_sensitive(str(exc)),
             )
+    from app.adapters.poi import mock as mock_poi
+
     return wrap_tool_with_fault_injection("poi", mock_poi)
 
 
@@ -79,11 +76,15 @@ def get_route_tool():
                 "Failed to load amap route adapter, fallback to mock: %s",
                 redact_sensitive(str(exc)),
             )
+    from app.adapters.route import mock as mock_route
+
     return wrap_tool_with_fault_injection("route", mock_route)
 
 
 def get_budget_tool():
     _ensure_tool_allowed("budget")
+    from app.adapters.budget import mock as mock_budget
+
     return wrap_tool_with_fault_injection("budget", mock_budget)
 
 
@@ -102,11 +103,15 @@ def get_weather_tool():
                 "Failed to load amap weather adapter, fallback to mock: %s",
                 redact_sensitive(str(exc)),
             )
+    from app.adapters.weather import mock as mock_weather
+
     return wrap_tool_with_fault_injection("weather", mock_weather)
 
 
 def get_calendar_tool():
     _ensure_tool_allowed("calendar")
+    from app.adapters.calendar import mock as mock_calendar
+
     return wrap_tool_with_fault_injection("calendar", mock_calendar)
 
 
@@ -1,7 +1,15 @@
 """Weather adapters."""
 
 from app.adapters.weather.mock import get_weather as mock_get_weather
-from app.adapters.weather.real import get_weather as real_get_weather
 
 __all__ = ["mock_get_weather", "real_get_weather"]
 
+
+def __getattr__(name: str):
+    # Real adapters pull in the HTTP client stack; load them on first access only.
+    if name in {"real_get_weather"}:
+        from app.adapters.weather import real
+
+        return getattr(real, name.removeprefix("real_"))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
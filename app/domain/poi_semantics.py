@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+
 from app.domain.enums import PoiSemanticType
 from app.domain.models import POI
 
@@ -100,8 +102,18 @@ _GENERIC_THEMES = {
 }
 
 
-def _contains_any(text: str, keywords: tuple[str, ...]) -> bool:
-    return any(keyword in text for keyword in keywords)
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+_INFRASTRUCTURE_CATEGORY_RE = _keyword_pattern(_INFRASTRUCTURE_CATEGORY_KEYWORDS)
+_INFRASTRUCTURE_TEXT_RE = _keyword_pattern(_INFRASTRUCTURE_TEXT_KEYWORDS)
+_NON_EXPERIENCE_SERVICE_RE = _keyword_pattern(_NON_EXPERIENCE_SERVICE_KEYWORDS)
+_EXPERIENCE_RE = _keyword_pattern(_EXPERIENCE_KEYWORDS)
+
+
+def _contains_any(text: str, pattern: re.Pattern[str]) -> bool:
+    return pattern.search(text) is not None
 
 
 def _normalize(text: str) -> str:
@@ -116,13 +128,13 @@ def classify_poi_semantic(poi: POI) -> tuple[PoiSemanticType, float]:
     category = _normalize(poi.source_category)
     text_blob = _poi_text_blob(poi)
 
-    if _contains_any(category, _INFRASTRUCTURE_CATEGORY_KEYWORDS):
+    if _contains_any(category, _INFRASTRUCTURE_CATEGORY_RE):
         return PoiSemanticType.INFRASTRUCTURE, 0.95
-    if _contains_any(text_blob, _INFRASTRUCTURE_TEXT_KEYWORDS):
+    if _contains_any(text_blob, _INFRASTRUCTURE_TEXT_RE):
         return PoiSemanticType.INFRASTRUCTURE, 0.9
-    if _contains_any(text_blob, _NON_EXPERIENCE_SERVICE_KEYWORDS):
+    if _contains_any(text_blob, _NON_EXPERIENCE_SERVICE_RE):
         return PoiSemanticType.INFRASTRUCTURE, 0.88
-    if _contains_any(text_blob, _EXPERIENCE_KEYWORDS):
+    if _contains_any(text_blob, _EXPERIENCE_RE):
         return PoiSemanticType.EXPERIENCE, 0.85
 
     themed = {_normalize(theme) for theme in poi.themes}
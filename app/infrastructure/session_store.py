@@ -16,6 +16,11 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     redis = None
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 _logger = logging.getLogger("trip-agent.session")
 
 _DEFAULT_TTL = 1800.0
@@ -23,6 +28,22 @@ _MAX_SESSIONS = 1000
 _DEFAULT_PREFIX = "trip-agent:session:"
 
 
+def _dumps_state(state: dict[str, Any]) -> str | bytes:
+    if orjson is not None:
+        return orjson.dumps(state, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(state, ensure_ascii=False, default=str)
+
+
+def _loads_state(raw: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Records written by json.dumps may hold NaN/Infinity, which orjson rejects.
+            pass
+    return json.loads(raw)
+
+
 class SessionStore:
     """Thread-safe in-memory session store."""
 
@@ -100,13 +121,13 @@ class RedisSessionStore:
         if raw is None:
             return None
         try:
-            return json.loads(raw)
+            return _loads_state(raw)
         except json.JSONDecodeError:
             self._client.delete(self._key(session_id))
             return None
 
     def save(self, session_id: str, state: dict[str, Any]) -> None:
-        payload = json.dumps(state, ensure_ascii=False, default=str)
+        payload = _dumps_state(state)
         self._client.setex(self._key(session_id), self._ttl, payload)
 
     def delete(self, session_id: str) -> None:
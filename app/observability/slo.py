@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import operator
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 
 @dataclass(frozen=True)
@@ -50,8 +51,13 @@ def _metric_from_snapshot(snapshot: dict[str, Any]) -> dict[str, float]:
 
 
 def infer_slo_profile(snapshot: dict[str, Any], *, realtime_l0_ratio_min: float = 0.3) -> str:
-    metrics = _metric_from_snapshot(snapshot)
-    return "realtime" if metrics.get("l0_ratio", 0.0) >= max(0.0, float(realtime_l0_ratio_min)) else "degraded"
+    threshold = max(0.0, float(realtime_l0_ratio_min))
+    degrade_counts = snapshot.get("degrade_counts")
+    l0_count = _safe_float(degrade_counts.get("L0", 0)) if isinstance(degrade_counts, dict) else 0.0
+    if not l0_count:
+        return "realtime" if threshold <= 0.0 else "degraded"
+    total_requests = max(1.0, _safe_float(snapshot.get("total_requests", 0)))
+    return "realtime" if l0_count / total_requests >= threshold else "degraded"
 
 
 def resolve_slo_objectives(
@@ -92,18 +98,20 @@ def resolve_slo_objectives(
     return selected_profile, list(selected)
 
 
+_COMPARATORS: dict[str, Callable[[float, float], bool]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": lambda actual, target: abs(actual - target) < 1e-9,
+}
+
+
 def _compare(actual: float, op: str, target: float) -> bool:
-    if op == ">=":
-        return actual >= target
-    if op == "<=":
-        return actual <= target
-    if op == ">":
-        return actual > target
-    if op == "<":
-        return actual < target
-    if op == "==":
-        return abs(actual - target) < 1e-9
-    raise ValueError(f"unsupported operator: {op}")
+    comparator = _COMPARATORS.get(op)
+    if comparator is None:
+        raise ValueError(f"unsupported operator: {op}")
+    return comparator(actual, target)
 
 
 def evaluate_slo_objectives(snapshot: dict[str, Any], objectives: list[dict[str, Any]]) -> dict[str, Any]:
@@ -116,7 +124,7 @@ def evaluate_slo_objectives(snapshot: dict[str, Any], objectives: list[dict[str,
         metric = str(row.get("metric", "")).strip()
         op = str(row.get("op", ">=")).strip()
         target = _safe_float(row.get("target", 0.0))
-        actual = _safe_float(metrics.get(metric, 0.0))
+        actual = metrics.get(metric, 0.0)
         passed = _compare(actual, op, target)
         checks.append(
             SLOCheckResult(
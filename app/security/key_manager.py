@@ -127,6 +127,10 @@ class KeyManager:
         elif name in self._keys:
             del self._keys[name]
 
+    def reload_all(self) -> None:
+        """清空全部已缓存 Key，下次读取时从环境变量重新加载"""
+        self._keys.clear()
+
 
 # ── 全局单例 ──────────────────────────────────────────
 
@@ -19,9 +19,7 @@ def no_real_apis(monkeypatch):
     from app.infrastructure.llm_factory import reset_llm
     from app.security.key_manager import get_key_manager
 
-    km = get_key_manager()
-    for key_name in ("DASHSCOPE_API_KEY", "OPENAI_API_KEY", "LLM_API_KEY", "AMAP_API_KEY"):
-        km.reload(key_name)
+    get_key_manager().reload_all()
 
     reset_llm()
     yield
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+from types import SimpleNamespace
+
+import tools.loadtest_http as loadtest_http
 from tools.loadtest_http import (
+    LatencyHistogram,
+    LatencyReservoir,
     LoadTestConfig,
     RequestResult,
     _capacity_conclusion,
-    _percentile,
+    _nearest_rank,
     summarize_results,
 )
 
 
-def _config() -> LoadTestConfig:
-    return LoadTestConfig(
+def _config(**overrides) -> LoadTestConfig:
+    values = dict(
         base_url="http://127.0.0.1:8000",
         endpoint="/plan",
         total_requests=1000,
@@ -23,13 +29,56 @@ def _config() -> LoadTestConfig:
         target_p95_ms=3000.0,
         target_concurrency=500,
     )
+    values.update(overrides)
+    return LoadTestConfig(**values)
+
+
+def _percentile(values: list[float], ratio: float) -> float:
+    # Exact nearest-rank percentile over the full sample, the histogram's reference.
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return float(ordered[_nearest_rank(len(ordered), ratio)])
+
+
+def test_nearest_rank_handles_empty_and_common_ratios():
+    assert _nearest_rank(0, 0.95) == 0
+    assert _nearest_rank(5, 0.50) == 2
+    assert _nearest_rank(5, 0.95) == 4
+    assert _nearest_rank(5, 1.5) == 4
+    assert _nearest_rank(5, -0.1) == 0
+    assert _percentile([10.0, 20.0, 30.0, 40.0, 50.0], 0.50) == 30.0
+
+
+def test_latency_histogram_matches_exact_percentiles_within_precision():
+    histogram = LatencyHistogram()
+    assert histogram.percentiles((0.5,)) == [0.0]
+
+    values = [float(index) * 1.7 for index in range(1, 5001)]
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.total == 5000
+    assert len(histogram.counts) < len(values)
+    ratios = (0.5, 0.95, 0.99, 1.0)
+    for ratio, observed in zip(ratios, histogram.percentiles(ratios)):
+        expected = _percentile(values, ratio)
+        assert abs(observed - expected) <= expected / 1000
+    assert histogram.percentiles((1.0,)) == [max(values)]
 
 
-def test_percentile_handles_empty_and_common_ratios():
-    assert _percentile([], 0.95) == 0.0
-    values = [10.0, 20.0, 30.0, 40.0, 50.0]
-    assert _percentile(values, 0.50) == 30.0
-    assert _percentile(values, 0.95) == 50.0
+def test_latency_reservoir_keeps_bounded_reproducible_uniform_sample():
+    first = LatencyReservoir(100, seed=7)
+    second = LatencyReservoir(100, seed=7)
+    for value in range(10_000):
+        first.add(float(value))
+        second.add(float(value))
+
+    assert first.seen == 10_000
+    assert len(first.samples) == 100
+    assert first.samples == second.samples
+    assert len(set(first.samples)) == 100
+    assert 3000 < sum(first.samples) / len(first.samples) < 7000
 
 
 def test_capacity_conclusion_passes_when_targets_met():
@@ -76,8 +125,79 @@ def test_summarize_results_aggregates_status_and_errors():
     assert report["total_requests"] == 1000
     assert report["success_count"] == 2
     assert report["error_count"] == 2
+    assert report["avg_latency_ms"] == 135.0
+    assert report["max_latency_ms"] == 300.0
     assert report["status_counts"]["200"] == 2
     assert report["status_counts"]["429"] == 1
     assert report["status_counts"]["0"] == 1
     assert report["error_counts"]["rate_limited"] == 1
     assert report["error_counts"]["ConnectError"] == 1
+    assert "latency_samples_ms" not in report
+
+
+def _fake_request():
+    stats = SimpleNamespace(in_flight=0, peak=0, calls=0)
+
+    async def fake_request(**_kwargs):
+        stats.calls += 1
+        stats.in_flight += 1
+        stats.peak = max(stats.peak, stats.in_flight)
+        await asyncio.sleep(0)
+        stats.in_flight -= 1
+        return RequestResult(ok=True, status_code=200, latency_ms=1.0, error="")
+
+    return fake_request, stats
+
+
+def test_run_burst_bounds_in_flight_requests_by_concurrency(monkeypatch):
+    fake_request, stats = _fake_request()
+    monkeypatch.setattr(loadtest_http, "_run_single_request", fake_request)
+    aggregate = asyncio.run(
+        loadtest_http._run_burst(_config(total_requests=57, concurrency=8, warmup_requests=0))
+    )
+
+    assert aggregate.count == 57
+    assert aggregate.success_count == 57
+    assert aggregate.status_counts == {"200": 57}
+    assert stats.peak == 8
+
+
+def test_run_burst_issues_warmup_requests_concurrently(monkeypatch):
+    fake_request, stats = _fake_request()
+    monkeypatch.setattr(loadtest_http, "_run_single_request", fake_request)
+    aggregate = asyncio.run(
+        loadtest_http._run_burst(_config(total_requests=1, concurrency=8, warmup_requests=6))
+    )
+
+    assert aggregate.count == 1
+    assert stats.calls == 7
+    assert stats.peak == 6
+
+
+def test_run_burst_warmup_waves_are_bounded_by_concurrency(monkeypatch):
+    fake_request, stats = _fake_request()
+    monkeypatch.setattr(loadtest_http, "_run_single_request", fake_request)
+    aggregate = asyncio.run(
+        loadtest_http._run_burst(_config(total_requests=3, concurrency=4, warmup_requests=10))
+    )
+
+    assert aggregate.count == 3
+    assert stats.calls == 13
+    assert stats.peak == 4
+
+
+def test_write_reports_creates_json_and_markdown(tmp_path):
+    report = summarize_results(
+        config=_config(),
+        started_at=0.0,
+        completed_at=1.0,
+        results=[RequestResult(ok=True, status_code=200, latency_ms=10.0, error="")],
+    )
+    report_dir = tmp_path / "reports"
+
+    json_path, md_path = asyncio.run(
+        loadtest_http._write_reports(report=report, report_dir=report_dir, json_body="{}\n")
+    )
+
+    assert json_path.read_text(encoding="utf-8") == "{}\n"
+    assert md_path.read_text(encoding="utf-8").startswith("# Load Test Report")
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
 
-from tools.product_readiness import build_readiness_report
+import tools.product_readiness as product_readiness
+from tools.product_readiness import build_readiness_report, main
 
 
 def _write(path: Path, payload: dict) -> None:
@@ -13,8 +16,7 @@ def _write(path: Path, payload: dict) -> None:
     path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
-def test_build_readiness_report_all_green(tmp_path: Path) -> None:
-    report_dir = tmp_path / "reports"
+def _write_green_reports(report_dir: Path) -> None:
     _write(report_dir / "product_acceptance_latest.json", {"full_passed": True})
     _write(report_dir / "frontend_e2e_latest.json", {"stats": {"expected": 3, "unexpected": 0}})
     _write(
@@ -34,10 +36,25 @@ def test_build_readiness_report_all_green(tmp_path: Path) -> None:
     )
     _write(report_dir / "ci_remote_latest.json", {"latest_all_green": True, "latest_run_id": 1, "latest_run_conclusion": "success"})
 
+
+def test_build_readiness_report_all_green(tmp_path: Path) -> None:
+    report_dir = tmp_path / "reports"
+    _write_green_reports(report_dir)
+
     report = build_readiness_report(report_dir)
 
     assert report["overall_passed"] is True
-    assert len(report["checks"]) == 9
+    assert [row["name"] for row in report["checks"]] == [
+        "full_acceptance",
+        "frontend_e2e",
+        "capacity_500_concurrency",
+        "slo_degraded",
+        "slo_realtime",
+        "dependency_fault_drill",
+        "persistence_drill",
+        "observability_stack",
+        "remote_ci_green",
+    ]
 
 
 def test_build_readiness_report_fails_without_passing_loadtest(tmp_path: Path) -> None:
@@ -66,3 +83,91 @@ def test_build_readiness_report_fails_without_passing_loadtest(tmp_path: Path) -
     assert report["overall_passed"] is False
     capacity = [row for row in report["checks"] if row["name"] == "capacity_500_concurrency"][0]
     assert capacity["passed"] is False
+
+
+def test_latest_loadtest_picks_newest_passing_report(tmp_path: Path) -> None:
+    report_dir = tmp_path / "reports"
+    assert product_readiness._latest_loadtest(report_dir) == (None, None)
+
+    passing = {"capacity_conclusion": {"meets_target": True}}
+    for offset, (name, payload) in enumerate(
+        [
+            ("loadtest_old.json", passing),
+            ("loadtest_new.json", passing),
+            ("loadtest_newest_failed.json", {"capacity_conclusion": {"meets_target": False}}),
+        ]
+    ):
+        path = report_dir / name
+        _write(path, payload)
+        os.utime(path, ns=(1_000_000_000 * (offset + 1), 1_000_000_000 * (offset + 1)))
+
+    path, payload = product_readiness._latest_loadtest(report_dir)
+
+    assert path == report_dir / "loadtest_new.json"
+    assert payload == passing
+
+
+def test_main_prints_the_same_json_it_writes(tmp_path: Path, capsys) -> None:
+    report_dir = tmp_path / "reports"
+    _write_green_reports(report_dir)
+    output_json = tmp_path / "out" / "readiness.json"
+
+    exit_code = main(
+        [
+            "--report-dir",
+            str(report_dir),
+            "--output-json",
+            str(output_json),
+            "--output-md",
+            str(tmp_path / "out" / "readiness.md"),
+        ]
+    )
+
+    assert exit_code == 0
+    assert capsys.readouterr().out == output_json.read_text(encoding="utf-8")
+    markdown = (tmp_path / "out" / "readiness.md").read_text(encoding="utf-8")
+    assert "| full_acceptance | True | full_passed=True |" in markdown
+
+
+def test_now_utc_formats_zero_padded_iso_timestamp(monkeypatch) -> None:
+    fixed = time.struct_time((2026, 2, 3, 4, 5, 6, 1, 34, 0))
+    monkeypatch.setattr(product_readiness.time, "gmtime", lambda: fixed)
+
+    assert product_readiness._now_utc() == "2026-02-03T04:05:06Z"
+
+
+def test_build_readiness_report_fast_fail_stops_at_first_failure(tmp_path: Path) -> None:
+    report_dir = tmp_path / "reports"
+    _write(report_dir / "product_acceptance_latest.json", {"full_passed": True})
+    _write(report_dir / "frontend_e2e_latest.json", {"stats": {"expected": 3, "unexpected": 1}})
+
+    # The remaining reports do not exist, so reaching them would raise.
+    report = build_readiness_report(report_dir, fast_fail=True)
+
+    assert report["overall_passed"] is False
+    assert [row["name"] for row in report["checks"]] == ["full_acceptance", "frontend_e2e"]
+    assert report["skipped_checks"] == 7
+
+
+def test_build_readiness_report_fast_fail_runs_everything_when_green(tmp_path: Path) -> None:
+    report_dir = tmp_path / "reports"
+    _write_green_reports(report_dir)
+
+    report = build_readiness_report(report_dir, fast_fail=True)
+
+    assert report["overall_passed"] is True
+    assert len(report["checks"]) == 9
+    assert report["skipped_checks"] == 0
+
+
+def test_slo_check_without_metrics_key_reports_zeroed_metrics(tmp_path: Path) -> None:
+    report_dir = tmp_path / "reports"
+    _write_green_reports(report_dir)
+    _write(report_dir / "slo_latest.json", {"passed": True})
+
+    report = build_readiness_report(report_dir)
+
+    slo = [row for row in report["checks"] if row["name"] == "slo_degraded"][0]
+    assert slo["detail"] == "success_rate=0.0000, p95_latency_ms=0.00"
+    drill = [row for row in report["checks"] if row["name"] == "persistence_drill"][0]
+    assert drill["detail"] == "passed=True"
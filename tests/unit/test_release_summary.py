@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
-from tools.release_summary import build_summary, render_summary_text
+from tools.release_summary import (
+    _confidence_from_rows,
+    build_summary,
+    load_latest_eval_report,
+    render_summary_text,
+)
 
 
 def test_build_summary_uses_confidence_metrics_when_available():
@@ -78,3 +84,32 @@ def test_build_summary_computes_confidence_from_case_rows_when_metric_missing():
     assert summary["confidence"]["p50"] == 0.6
     assert summary["confidence"]["p90"] == 0.8
     assert "- confidence_mean: 0.5667" in rendered
+
+
+def test_confidence_from_rows_handles_unsorted_scores_and_skips_invalid_rows():
+    rows = [
+        {"confidence_score_case": 0.9},
+        "not-a-row",
+        {"confidence_score_case": 0.1},
+        {"confidence_score_case": None},
+        {"confidence_score_case": 0.5},
+    ]
+
+    confidence = _confidence_from_rows(rows)
+
+    assert confidence == {"samples": 3, "mean": 0.5, "p50": 0.5, "p90": 0.9}
+
+
+def test_load_latest_eval_report_picks_greatest_name_then_latest_fallback(tmp_path):
+    assert load_latest_eval_report(tmp_path) is None
+
+    (tmp_path / "latest.json").write_text(json.dumps({"id": "latest"}), encoding="utf-8")
+    assert load_latest_eval_report(tmp_path) == (tmp_path / "latest.json", {"id": "latest"})
+
+    for stamp in ("20260221_090000", "20260223_080000", "20260222_235959"):
+        path = tmp_path / f"eval_{stamp}.json"
+        path.write_text(json.dumps({"id": stamp}), encoding="utf-8")
+
+    path, payload = load_latest_eval_report(tmp_path)
+    assert path == tmp_path / "eval_20260223_080000.json"
+    assert payload == {"id": "20260223_080000"}
@@ -0,0 +1,112 @@
+"""Tests for the JSON report helpers shared by the release tools."""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+import os
+from pathlib import Path
+
+import pytest
+
+from tools import _report_json as report_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        if report_json.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(report_json, "orjson", None)
+    report_json._parse_json_file.cache_clear()
+    yield request.param
+    report_json._parse_json_file.cache_clear()
+
+
+def test_json_helpers_match_stdlib(json_backend) -> None:
+    payload = {
+        "generated_at": "2026-02-23T00:00:00Z",
+        "checks": [{"name": "北京", "passed": True, "success_rate": 0.995, "p95_ms": 1234.5}],
+    }
+    expected = json.dumps(payload, ensure_ascii=False, indent=2)
+
+    assert report_json.dumps_json_bytes(payload).decode("utf-8") == expected
+    assert report_json.dumps_json_compact_bytes(payload).decode("utf-8") == json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":")
+    )
+    assert report_json.loads_json(expected) == payload
+    assert report_json.loads_json(expected.encode("utf-8")) == payload
+
+
+def test_json_helpers_round_trip_small_exponent_floats(json_backend) -> None:
+    # orjson writes 1e-6 where json writes 1e-06; only the parsed values must agree.
+    payload = {"error_rate": 1e-6, "p50_s": 2.5e-05, "budget": 1e20}
+
+    assert report_json.loads_json(report_json.dumps_json_bytes(payload)) == payload
+    assert report_json.loads_json(json.dumps(payload)) == payload
+
+
+def test_json_helpers_keep_non_finite_floats(json_backend) -> None:
+    payload = {"metrics": {"latency_ms": [float("inf"), -float("inf")], "ratio": float("nan")}}
+    stdlib_text = json.dumps(payload, ensure_ascii=False, indent=2)
+
+    assert report_json.dumps_json_bytes(payload).decode("utf-8") == stdlib_text
+    assert report_json.dumps_json_compact_bytes(payload) == json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    parsed = report_json.loads_json(stdlib_text.encode("utf-8"))
+    assert parsed["metrics"]["latency_ms"] == [float("inf"), -float("inf")]
+    assert math.isnan(parsed["metrics"]["ratio"])
+
+
+def test_read_json_accepts_stdlib_non_finite_tokens(tmp_path: Path, json_backend) -> None:
+    path = tmp_path / "release_gate_latest.json"
+    path.write_text('{"passed": false, "score": NaN, "p95_ms": Infinity}', encoding="utf-8")
+
+    payload = report_json.read_json(path)
+    assert payload["p95_ms"] == float("inf")
+    assert math.isnan(payload["score"])
+
+
+def test_loads_json_still_rejects_malformed_input(json_backend) -> None:
+    with pytest.raises(ValueError):
+        report_json.loads_json(b'{"passed": ')
+
+
+def test_read_json_reuses_parsed_payload_until_file_changes(tmp_path: Path, json_backend) -> None:
+    path = tmp_path / "slo_latest.json"
+    path.write_text(json.dumps({"passed": True}), encoding="utf-8")
+
+    first = report_json.read_json(path)
+    assert report_json.read_json(path) is first
+
+    path.write_text(json.dumps({"passed": False}), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert report_json.read_json(path) == {"passed": False}
+
+
+def test_read_json_accepts_utf8_bom(tmp_path: Path, json_backend) -> None:
+    path = tmp_path / "ci_remote_latest.json"
+    path.write_bytes(b"\xef\xbb\xbf" + json.dumps({"conclusion": "成功"}).encode("utf-8"))
+
+    assert report_json.read_json(path) == {"conclusion": "成功"}
+
+
+def test_write_stdout_matches_text_layer_output(monkeypatch) -> None:
+    data = '{"detail": "北京"}\n'.encode("utf-8")
+    for encoding in ("utf-8", "gbk"):
+        for linesep in ("\n", "\r\n"):
+            raw = io.BytesIO()
+            # Stands in for the platform stdout, which translates "\n" to os.linesep.
+            stream = io.TextIOWrapper(raw, encoding=encoding, newline=linesep)
+            monkeypatch.setattr(report_json.sys, "stdout", stream)
+            monkeypatch.setattr(report_json.os, "linesep", linesep)
+
+            report_json.write_stdout(data)
+            stream.flush()
+
+            expected = data.decode("utf-8").replace("\n", linesep).encode(encoding)
+            assert raw.getvalue() == expected
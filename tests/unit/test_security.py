@@ -71,6 +71,15 @@ class TestKeyManager:
         assert len(log) == 2
         assert log[0]["key"] == "AMAP_API_KEY"
 
+    def test_reload_all_picks_up_env_changes(self, monkeypatch):
+        monkeypatch.setenv("AMAP_API_KEY", "old_key_value")
+        from app.security.key_manager import KeyManager
+        km = KeyManager()
+        assert km.get("AMAP_API_KEY") == "old_key_value"
+        monkeypatch.setenv("AMAP_API_KEY", "new_key_value")
+        km.reload_all()
+        assert km.get("AMAP_API_KEY") == "new_key_value"
+
 
 class TestAmapSigner:
     """高德签名测试"""
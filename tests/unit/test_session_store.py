@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import pytest
+from app.infrastructure import session_store
+from app.infrastructure.session_store import RedisSessionStore
+
+
+class _FakeRedis:
+    """In-process stand-in for ``redis.Redis(decode_responses=True)``."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    def ping(self) -> bool:
+        return True
+
+    def get(self, key: str):
+        return self.data.get(key)
+
+    def setex(self, key: str, ttl: int, value) -> None:
+        self.data[key] = value.decode("utf-8") if isinstance(value, bytes) else value
+        self.ttls[key] = ttl
+
+    def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    def exists(self, key: str) -> int:
+        return int(key in self.data)
+
+    def scan_iter(self, match: str):
+        prefix = match.rstrip("*")
+        return [key for key in self.data if key.startswith(prefix)]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def redis_store(request, monkeypatch):
+    if request.param == "orjson":
+        if session_store.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(session_store, "orjson", None)
+    client = _FakeRedis()
+    fake_module = SimpleNamespace(Redis=SimpleNamespace(from_url=lambda *_args, **_kwargs: client))
+    monkeypatch.setattr(session_store, "redis", fake_module)
+    return RedisSessionStore("redis://fake", ttl=60, prefix="test:"), client
+
+
+def test_redis_session_store_round_trips_state(redis_store):
+    store, client = redis_store
+    state = {"city": "北京", "days": 3, "budget": 1200.5, "tags": ["food"], "done": False}
+
+    store.save("s1", state)
+
+    assert store.get("s1") == state
+    assert client.ttls["test:s1"] == 60
+    assert store.exists("s1")
+    assert store.active_count == 1
+    store.delete("s1")
+    assert store.get("s1") is None
+
+
+def test_redis_session_store_reads_legacy_non_finite_records(redis_store):
+    store, client = redis_store
+    # json.dumps(..., allow_nan=True) wrote these tokens before orjson was used.
+    client.data["test:legacy"] = '{"score": NaN, "cost": Infinity, "city": "上海"}'
+
+    state = store.get("legacy")
+
+    assert state is not None
+    assert math.isnan(state["score"])
+    assert state["cost"] == float("inf")
+    assert "test:legacy" in client.data
+
+
+def test_redis_session_store_drops_corrupt_records(redis_store):
+    store, client = redis_store
+    client.data["test:broken"] = '{"city": '
+
+    assert store.get("broken") is None
+    assert "test:broken" not in client.data
@@ -1,5 +1,8 @@
 """Single entrypoint guard tests."""
 
+import os
+
+import tools.check_single_entrypoint as guard
 from tools.check_single_entrypoint import check_single_entrypoint
 
 
@@ -7,3 +10,91 @@ def test_single_entrypoint_guard():
     violations = check_single_entrypoint()
     assert violations == [], "Single entrypoint violations:\n" + "\n".join(violations)
 
+
+def test_single_entrypoint_guard_reparses_edited_file(tmp_path):
+    bridge = tmp_path / "bridge.py"
+    bridge.write_text(
+        "from app.application.plan_trip import plan_trip\n\n\ndef run():\n    return plan_trip()\n",
+        encoding="utf-8",
+    )
+    assert check_single_entrypoint([bridge]) == []
+
+    bridge.write_text(
+        "from app.agent.graph import compile_graph\n\n\ndef run():\n    return compile_graph()\n",
+        encoding="utf-8",
+    )
+    stat = bridge.stat()
+    os.utime(bridge, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    violations = check_single_entrypoint([bridge])
+    assert any("forbidden import `app.agent.graph.compile_graph`" in line for line in violations)
+    assert any("direct graph import" in line for line in violations)
+    assert any("missing import of single entrypoint plan_trip" in line for line in violations)
+
+
+def test_single_entrypoint_guard_reports_unrelated_file_without_parsing(tmp_path):
+    # Not valid Python: the sentinel prefilter must answer before ast.parse runs.
+    bridge = tmp_path / "bridge.py"
+    bridge.write_text("def broken(:\n", encoding="utf-8")
+
+    violations = check_single_entrypoint([bridge])
+
+    assert violations == [f"{bridge.as_posix()}: missing import of single entrypoint plan_trip"]
+
+
+def test_single_entrypoint_guard_reuses_cached_results_for_unchanged_files(tmp_path, monkeypatch):
+    bridge = tmp_path / "bridge.py"
+    bridge.write_text("from app.agent import graph\n", encoding="utf-8")
+    cache_path = tmp_path / "cache" / "entrypoint.json"
+
+    first = check_single_entrypoint([bridge], cache_path=cache_path)
+    assert cache_path.exists()
+
+    def fail_check(_path):
+        raise AssertionError("unchanged file must be served from the cache")
+
+    monkeypatch.setattr(guard, "_check_file", fail_check)
+    assert check_single_entrypoint([bridge], cache_path=cache_path) == first
+
+    bridge.write_text("from app.application.plan_trip import plan_trip\n", encoding="utf-8")
+    monkeypatch.undo()
+    assert check_single_entrypoint([bridge], cache_path=cache_path) == []
+
+
+def test_single_entrypoint_guard_discards_cache_when_guard_changes(tmp_path, monkeypatch):
+    bridge = tmp_path / "bridge.py"
+    bridge.write_text("from app.application.plan_trip import plan_trip\n", encoding="utf-8")
+    cache_path = tmp_path / "cache" / "entrypoint.json"
+    check_single_entrypoint([bridge], cache_path=cache_path)
+
+    checked: list = []
+
+    def record_check(path):
+        checked.append(path)
+        return []
+
+    monkeypatch.setattr(guard, "_check_file", record_check)
+    check_single_entrypoint([bridge], cache_path=cache_path)
+    assert checked == []
+
+    monkeypatch.setattr(guard, "_ENTRYPOINT_CALL_NAMES", frozenset({"plan_trip"}))
+    check_single_entrypoint([bridge], cache_path=cache_path)
+    assert checked == [bridge]
+
+    monkeypatch.setattr(guard, "_guard_source_digest", lambda: "edited")
+    check_single_entrypoint([bridge], cache_path=cache_path)
+    assert checked == [bridge, bridge]
+
+
+def test_single_entrypoint_guard_parallel_path_matches_serial(tmp_path, monkeypatch):
+    files = []
+    for index in range(3):
+        bridge = tmp_path / f"bridge_{index}.py"
+        source = "from app.agent import graph\n" if index % 2 else "import os\n"
+        bridge.write_text(source, encoding="utf-8")
+        files.append(bridge)
+
+    serial = check_single_entrypoint(files)
+    monkeypatch.setattr(guard, "_PARALLEL_MIN_FILES", 2)
+
+    assert check_single_entrypoint(files) == serial
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from tools import slo_check
+
+
+def _install_client(monkeypatch, handler) -> None:
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(slo_check, "_metrics_client", client)
+
+
+def test_fetch_metrics_snapshot_reuses_client_and_sends_auth(monkeypatch):
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"success_rate": 1.0})
+
+    _install_client(monkeypatch, handler)
+
+    assert slo_check._fetch_metrics_snapshot("http://svc/", token=" t0k ") == {"success_rate": 1.0}
+    assert slo_check._fetch_metrics_snapshot("http://svc") == {"success_rate": 1.0}
+
+    assert [str(request.url) for request in seen] == ["http://svc/metrics", "http://svc/metrics"]
+    assert seen[0].headers["Authorization"] == "Bearer t0k"
+    assert "Authorization" not in seen[1].headers
+    assert slo_check._METRICS_HEADERS == {"Accept": "application/json"}
+
+
+def test_fetch_metrics_snapshot_raises_on_http_error(monkeypatch):
+    _install_client(monkeypatch, lambda request: httpx.Response(401, text="nope"))
+
+    with pytest.raises(RuntimeError, match="status=401 body=nope"):
+        slo_check._fetch_metrics_snapshot("http://svc")
+
+
+def test_build_parser_is_memoized_and_parses_independent_namespaces():
+    parser = slo_check._build_parser()
+
+    assert slo_check._build_parser() is parser
+    first = parser.parse_args(["--metrics-json", "a.json", "--profile", "realtime"])
+    second = parser.parse_args(["--base-url", "http://svc"])
+    assert (first.metrics_json, first.profile) == ("a.json", "realtime")
+    assert (second.metrics_json, second.base_url, second.profile) == ("", "http://svc", "auto")
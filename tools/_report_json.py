@@ -0,0 +1,111 @@
+"""JSON report I/O shared by the release, readiness, SLO check and load-test tools."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import math
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads_json(raw: str | bytes) -> Any:
+    """Parse JSON text or bytes.
+
+    orjson rejects the ``NaN``/``Infinity`` tokens the stdlib writes for non-finite
+    floats (e.g. release gate reports), so such documents go through ``json.loads``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _contains_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_contains_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_non_finite(item) for item in value)
+    return False
+
+
+def dumps_json_bytes(value: Any) -> bytes:
+    """Render ``value`` as indented UTF-8 JSON (no trailing newline).
+
+    orjson spells some float exponents differently from ``json`` (``1e-6`` vs
+    ``1e-06``); the parsed values are equal. Payloads holding NaN/Infinity are
+    rendered by ``json`` because orjson would write them as ``null``.
+    """
+    if orjson is not None and not _contains_non_finite(value):
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def dumps_json_compact_bytes(value: Any) -> bytes:
+    """Render ``value`` as compact UTF-8 JSON, e.g. an HTTP request body."""
+    if orjson is not None and not _contains_non_finite(value):
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_stdout(data: bytes) -> None:
+    """Write UTF-8 ``data`` to stdout exactly as ``sys.stdout.write`` would.
+
+    The binary buffer is used only when the text layer would emit the same bytes:
+    a UTF-8 stream on a platform whose line separator is ``\\n``. Elsewhere (GBK
+    consoles, CRLF translation on Windows) the text layer does the work.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    encoding = getattr(sys.stdout, "encoding", None) or "ascii"
+    if buffer is None or os.linesep != "\n" or codecs.lookup(encoding).name != "utf-8":
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _read_file_bytes(path: Path) -> bytes:
+    # Reports are a few KB; raw fd reads skip the FileIO/buffer objects read_bytes builds.
+    fd = os.open(os.fspath(path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = [os.read(fd, os.fstat(fd).st_size + 1)]
+        # Keep reading until EOF in case the file grew or a read returned short.
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=64)
+def _parse_json_file(path: Path, mtime_ns: int, size: int) -> Any:
+    # mtime_ns and size are part of the cache key so rewritten files are re-parsed.
+    # Only a leading UTF-8 BOM needs stripping before the raw bytes are parsed.
+    return loads_json(_read_file_bytes(path).removeprefix(codecs.BOM_UTF8))
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file, reusing the cached payload while the file is unchanged.
+
+    The returned object is shared between calls and must not be mutated.
+    """
+    stat = path.stat()
+    return read_json_stat(path, stat.st_mtime_ns, stat.st_size)
+
+
+def read_json_stat(path: Path, mtime_ns: int, size: int) -> Any:
+    """Like :func:`read_json` for callers that already hold the file's stat result."""
+    return _parse_json_file(path.resolve(), mtime_ns, size)
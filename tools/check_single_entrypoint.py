@@ -4,6 +4,11 @@ from __future__ import annotations
 
 import argparse
 import ast
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 PRESENTATION_FILES = [
@@ -20,6 +25,10 @@ FORBIDDEN_PREFIXES = (
     "app.application.graph",
     "app.application.services.workflow",
 )
+_FORBIDDEN_EXACT = frozenset(FORBIDDEN_PREFIXES)
+_FORBIDDEN_DOTTED = tuple(f"{prefix}." for prefix in FORBIDDEN_PREFIXES)
+_GRAPH_BUILDER_SUFFIXES = (".compile_graph", ".build_graph")
+_ENTRYPOINT_CALL_NAMES = frozenset({"execute_plan", "plan_trip"})
 ALLOWED_PLAN_TRIP_IMPORTS = {
     "app.application.plan_trip.plan_trip",
     "app.application.plan_trip",
@@ -28,12 +37,40 @@ ALLOWED_PRESENTATION_IMPORTS = ALLOWED_PLAN_TRIP_IMPORTS | {
     "app.services.plan_service.execute_plan",
     "app.services.plan_service",
 }
+# Every allowed import, forbidden import and checked call name contains at
+# least one of these tokens, so sources without any of them need no parse.
+_SOURCE_SENTINELS = (
+    b"plan_trip",
+    b"plan_service",
+    b"execute_plan",
+    b"agent",
+    b"graph",
+    b"workflow",
+)
+# Below this many files, process-pool start-up costs more than parsing serially.
+_PARALLEL_MIN_FILES = 32
 
 
-def _collect_imports(tree: ast.AST) -> list[tuple[str, str | None]]:
+def _analyze_tree(tree: ast.AST) -> tuple[list[tuple[str, str | None]], set[str]]:
+    """Collect imports and entrypoint call names in a single tree walk."""
     imports: list[tuple[str, str | None]] = []
+    call_names: set[str] = set()
     for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
+        if isinstance(node, ast.Call):
+            # Calls are usually inside handler bodies, so the whole tree is
+            # walked; only the entrypoint names are worth recording.
+            if len(call_names) == len(_ENTRYPOINT_CALL_NAMES):
+                continue
+            func = node.func
+            if isinstance(func, ast.Name):
+                name = func.id
+            elif isinstance(func, ast.Attribute):
+                name = func.attr
+            else:
+                continue
+            if name in _ENTRYPOINT_CALL_NAMES:
+                call_names.add(name)
+        elif isinstance(node, ast.Import):
             for alias in node.names:
                 imports.append((alias.name, alias.asname))
         elif isinstance(node, ast.ImportFrom):
@@ -43,76 +80,165 @@ def _collect_imports(tree: ast.AST) -> list[tuple[str, str | None]]:
                     imports.append((f"{base}.{alias.name}", alias.asname))
                 else:
                     imports.append((alias.name, alias.asname))
-    return imports
+    return imports, call_names
 
 
-def _has_call(tree: ast.AST, names: set[str]) -> bool:
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call):
-            func = node.func
-            if isinstance(func, ast.Name) and func.id in names:
-                return True
-            if isinstance(func, ast.Attribute) and func.attr in names:
-                return True
-    return False
+@lru_cache(maxsize=256)
+def _analyze_source(
+    path: Path,
+    mtime_ns: int,
+    size: int,
+) -> tuple[tuple[tuple[str, str | None], ...], frozenset[str]]:
+    # mtime_ns and size are part of the cache key so edited files are re-parsed.
+    raw = path.read_bytes()
+    if not any(token in raw for token in _SOURCE_SENTINELS):
+        return (), frozenset()
+    tree = ast.parse(raw.decode("utf-8-sig"), filename=str(path))
+    imports, call_names = _analyze_tree(tree)
+    return tuple(imports), frozenset(call_names)
+
+
+def _analyze(path: Path) -> tuple[tuple[tuple[str, str | None], ...], frozenset[str]]:
+    stat = path.stat()
+    return _analyze_source(path.resolve(), stat.st_mtime_ns, stat.st_size)
 
 
-def check_single_entrypoint(files: list[Path] | None = None) -> list[str]:
+def _check_file(path: Path) -> list[str]:
+    if not path.exists():
+        return [f"{path.as_posix()}: file missing"]
+
     violations: list[str] = []
-    targets = files or (PRESENTATION_FILES + SERVICE_BRIDGE_FILES)
+    imports, call_names = _analyze(path)
 
-    for path in targets:
-        if not path.exists():
-            violations.append(f"{path.as_posix()}: file missing")
-            continue
-
-        source = path.read_text(encoding="utf-8-sig")
-        tree = ast.parse(source, filename=str(path))
-        imports = _collect_imports(tree)
-
-        has_allowed_import = False
-        for full_name, _alias in imports:
-            allowed_imports = (
-                ALLOWED_PRESENTATION_IMPORTS
-                if path in PRESENTATION_FILES
-                else ALLOWED_PLAN_TRIP_IMPORTS
+    allowed_imports = (
+        ALLOWED_PRESENTATION_IMPORTS
+        if path in PRESENTATION_FILES
+        else ALLOWED_PLAN_TRIP_IMPORTS
+    )
+    has_allowed_import = False
+    for full_name, _alias in imports:
+        if full_name in allowed_imports:
+            has_allowed_import = True
+
+        if full_name in _FORBIDDEN_EXACT or full_name.startswith(_FORBIDDEN_DOTTED):
+            violations.append(
+                f"{path.as_posix()}: forbidden import `{full_name}`; use app.application.plan_trip only"
             )
-            if full_name in allowed_imports:
-                has_allowed_import = True
-
-            if any(
-                full_name == prefix or full_name.startswith(prefix + ".")
-                for prefix in FORBIDDEN_PREFIXES
-            ):
-                violations.append(
-                    f"{path.as_posix()}: forbidden import `{full_name}`; use app.application.plan_trip only"
-                )
-
-            if full_name.endswith(".compile_graph") or full_name.endswith(".build_graph"):
-                violations.append(
-                    f"{path.as_posix()}: direct graph import `{full_name}` is forbidden"
-                )
-
-        if not has_allowed_import:
-            if path in PRESENTATION_FILES:
-                violations.append(
-                    f"{path.as_posix()}: missing import of execute_plan(...) or plan_trip(...)"
-                )
-            else:
-                violations.append(
-                    f"{path.as_posix()}: missing import of single entrypoint plan_trip"
-                )
 
-        if path in PRESENTATION_FILES and not _has_call(tree, {"execute_plan", "plan_trip"}):
+        if full_name.endswith(_GRAPH_BUILDER_SUFFIXES):
             violations.append(
-                f"{path.as_posix()}: missing call to execute_plan(...) or plan_trip(...)"
+                f"{path.as_posix()}: direct graph import `{full_name}` is forbidden"
             )
-        if path in SERVICE_BRIDGE_FILES and not _has_call(tree, {"plan_trip"}):
+
+    if not has_allowed_import:
+        if path in PRESENTATION_FILES:
+            violations.append(
+                f"{path.as_posix()}: missing import of execute_plan(...) or plan_trip(...)"
+            )
+        else:
             violations.append(
-                f"{path.as_posix()}: missing call to plan_trip(...)"
+                f"{path.as_posix()}: missing import of single entrypoint plan_trip"
             )
 
-    return sorted(set(violations))
+    if path in PRESENTATION_FILES and not call_names:
+        violations.append(
+            f"{path.as_posix()}: missing call to execute_plan(...) or plan_trip(...)"
+        )
+    if path in SERVICE_BRIDGE_FILES and "plan_trip" not in call_names:
+        violations.append(
+            f"{path.as_posix()}: missing call to plan_trip(...)"
+        )
+    return violations
+
+
+@lru_cache(maxsize=1)
+def _guard_source_digest() -> str:
+    # The checks and messages live in this module, so editing it invalidates the cache.
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def _rules_fingerprint() -> str:
+    rules = repr(
+        (
+            _guard_source_digest(),
+            [item.as_posix() for item in PRESENTATION_FILES],
+            [item.as_posix() for item in SERVICE_BRIDGE_FILES],
+            FORBIDDEN_PREFIXES,
+            _GRAPH_BUILDER_SUFFIXES,
+            sorted(_ENTRYPOINT_CALL_NAMES),
+            sorted(ALLOWED_PRESENTATION_IMPORTS),
+            sorted(ALLOWED_PLAN_TRIP_IMPORTS),
+        )
+    )
+    return hashlib.blake2b(rules.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _content_key(path: Path, raw: bytes) -> str:
+    # Violation messages embed the path, so it is hashed alongside the content.
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(path.as_posix().encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(raw)
+    return digest.hexdigest()
+
+
+def _load_cache(cache_path: Path) -> dict[str, list[str]]:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("rules") != _rules_fingerprint():
+        return {}
+    entries = payload.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_cache(cache_path: Path, entries: dict[str, list[str]]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    tmp_path.write_text(
+        json.dumps({"rules": _rules_fingerprint(), "entries": entries}, indent=2) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, cache_path)
+
+
+def _check_files(paths: list[Path]) -> list[list[str]]:
+    if len(paths) < _PARALLEL_MIN_FILES:
+        return [_check_file(path) for path in paths]
+    # Files are checked independently, so large batches fan out across cores.
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_check_file, paths, chunksize=8))
+
+
+def check_single_entrypoint(
+    files: list[Path] | None = None,
+    *,
+    cache_path: Path | None = None,
+) -> list[str]:
+    """Return sorted violations; with ``cache_path``, unchanged files reuse stored results."""
+    targets = files or (PRESENTATION_FILES + SERVICE_BRIDGE_FILES)
+    cached = _load_cache(cache_path) if cache_path is not None else None
+    keys: dict[Path, str] = {}
+    results: dict[Path, list[str]] = {}
+    to_check: list[Path] = []
+
+    for path in targets:
+        if cached is not None and path.exists():
+            key = _content_key(path, path.read_bytes())
+            keys[path] = key
+            hit = cached.get(key)
+            if hit is not None:
+                results[path] = hit
+                continue
+        to_check.append(path)
+    results.update(zip(to_check, _check_files(to_check)))
+
+    if cache_path is not None:
+        entries = {key: results[path] for path, key in keys.items()}
+        if entries != cached:
+            _save_cache(cache_path, entries)
+    return sorted({line for path in targets for line in results[path]})
 
 
 def main() -> int:
@@ -123,10 +249,16 @@ def main() -> int:
         default=[],
         help="Optional explicit file list to scan",
     )
+    parser.add_argument(
+        "--cache-file",
+        default="",
+        help="Optional per-file result cache keyed by content hash, e.g. .cache/entrypoint.json",
+    )
     args = parser.parse_args()
 
     files = [Path(item) for item in args.files] if args.files else None
-    violations = check_single_entrypoint(files)
+    cache_path = Path(args.cache_file) if args.cache_file else None
+    violations = check_single_entrypoint(files, cache_path=cache_path)
     if violations:
         print("Single entrypoint violations:")
         for line in violations:
@@ -6,29 +6,38 @@ import argparse
 import asyncio
 import json
 import os
+import random
 import signal
-import statistics
 import subprocess
 import sys
 import time
-from collections import Counter
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 import httpx
 
+from tools._report_json import dumps_json_bytes, dumps_json_compact_bytes
+
+try:
+    import uvloop
+except Exception:  # pragma: no cover - optional dependency, unavailable on Windows
+    uvloop = None
+
 _DEFAULT_REPORT_DIR = Path("eval") / "reports"
 _DEFAULT_HOST = "127.0.0.1"
 _DEFAULT_PORT = 18080
 _DEFAULT_TIMEOUT_SECONDS = 30.0
 _DEFAULT_TOTAL_REQUESTS = 1000
 _DEFAULT_CONCURRENCY = 500
-_DEFAULT_WARMUP_REQUESTS = 30
+_DEFAULT_WARMUP_REQUESTS = 50
 _DEFAULT_TARGET_SUCCESS_RATE = 0.99
 _DEFAULT_TARGET_P95_MS = 3000.0
 _DEFAULT_SPAWN_WORKERS = 1
+_LATENCY_SAMPLE_SEED = 0
 
 
 @dataclass(frozen=True)
@@ -44,6 +53,7 @@ class LoadTestConfig:
     target_success_rate: float
     target_p95_ms: float
     target_concurrency: int
+    latency_samples: int = 0
 
 
 @dataclass(frozen=True)
@@ -54,13 +64,113 @@ class RequestResult:
     error: str
 
 
-def _percentile(values: list[float], ratio: float) -> float:
-    if not values:
-        return 0.0
-    ordered = sorted(values)
+@dataclass
+class LatencyHistogram:
+    """HDR-style log-linear latency buckets with three significant digits.
+
+    Latencies are recorded in whole microseconds. Values below 2048us are
+    exact, and every wider bucket spans at most 1/1024 of its values, so memory
+    stays bounded by the latency range rather than by the request count.
+    """
+
+    counts: dict[int, int] = field(default_factory=dict)
+    total: int = 0
+    max_value_us: int = 0
+
+    _SUB_BUCKET_BITS = 11
+
+    def record(self, latency_ms: float) -> None:
+        value = max(0, round(latency_ms * 1000.0))
+        shift = max(0, value.bit_length() - self._SUB_BUCKET_BITS)
+        key = (value >> shift) << shift
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.total += 1
+        if value > self.max_value_us:
+            self.max_value_us = value
+
+    def percentiles(self, ratios: Sequence[float]) -> list[float]:
+        """Return nearest-rank percentiles in ms, ranked by ``_nearest_rank``."""
+        if not self.total:
+            return [0.0 for _ in ratios]
+        ranks = [_nearest_rank(self.total, ratio) for ratio in ratios]
+        values = [0.0] * len(ranks)
+        pending = sorted(range(len(ranks)), key=ranks.__getitem__)
+        seen = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            while pending and ranks[pending[0]] < seen:
+                # Report the bucket's highest equivalent value, capped at the real max.
+                shift = max(0, key.bit_length() - self._SUB_BUCKET_BITS)
+                upper = min(key + (1 << shift) - 1, self.max_value_us)
+                values[pending.pop(0)] = upper / 1000.0
+            if not pending:
+                break
+        return values
+
+
+@dataclass
+class LatencyReservoir:
+    """Uniform random sample of at most ``size`` latencies (Algorithm R)."""
+
+    size: int
+    seed: int = _LATENCY_SAMPLE_SEED
+    seen: int = 0
+    samples: array = field(default_factory=lambda: array("d"))
+    _rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+
+    def add(self, latency_ms: float) -> None:
+        self.seen += 1
+        if len(self.samples) < self.size:
+            self.samples.append(latency_ms)
+            return
+        slot = self._rng.randrange(self.seen)
+        if slot < self.size:
+            self.samples[slot] = latency_ms
+
+
+@dataclass
+class ResultAggregator:
+    """Running totals for a burst, updated as each request completes."""
+
+    count: int = 0
+    success_count: int = 0
+    max_latency_ms: float = 0.0
+    latency_sum_ms: float = 0.0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    reservoir: LatencyReservoir | None = None
+    status_counts: dict[str, int] = field(default_factory=dict)
+    error_counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, row: RequestResult) -> None:
+        latency_ms = max(0.0, row.latency_ms)
+        self.count += 1
+        if row.ok:
+            self.success_count += 1
+        if latency_ms > self.max_latency_ms:
+            self.max_latency_ms = latency_ms
+        self.latency_sum_ms += latency_ms
+        self.histogram.record(latency_ms)
+        if self.reservoir is not None:
+            self.reservoir.add(latency_ms)
+        status = str(row.status_code)
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        if row.error:
+            self.error_counts[row.error] = self.error_counts.get(row.error, 0) + 1
+
+    @classmethod
+    def from_results(cls, results: Iterable[RequestResult]) -> "ResultAggregator":
+        aggregate = cls()
+        for row in results:
+            aggregate.add(row)
+        return aggregate
+
+
+def _nearest_rank(count: int, ratio: float) -> int:
     safe_ratio = max(0.0, min(1.0, ratio))
-    idx = max(0, min(len(ordered) - 1, int((len(ordered) * safe_ratio) + 0.999999) - 1))
-    return float(ordered[idx])
+    return max(0, min(count - 1, int((count * safe_ratio) + 0.999999) - 1))
 
 
 def _iso_now() -> str:
@@ -120,15 +230,20 @@ def summarize_results(
     config: LoadTestConfig,
     started_at: float,
     completed_at: float,
-    results: list[RequestResult],
+    results: Iterable[RequestResult] | ResultAggregator,
 ) -> dict[str, Any]:
-    latencies = [max(0.0, row.latency_ms) for row in results]
-    status_counts = Counter(str(row.status_code) for row in results)
-    error_counts = Counter(row.error for row in results if row.error)
-    success_count = sum(1 for row in results if row.ok)
-    success_rate = (success_count / max(len(results), 1)) if results else 0.0
+    if isinstance(results, ResultAggregator):
+        aggregate = results
+    else:
+        aggregate = ResultAggregator.from_results(results)
+    p50_ms, p95_ms, p99_ms = aggregate.histogram.percentiles((0.50, 0.95, 0.99))
+    status_counts = aggregate.status_counts
+    error_counts = aggregate.error_counts
+    success_count = aggregate.success_count
+    success_rate = (success_count / aggregate.count) if aggregate.count else 0.0
     elapsed_seconds = max(0.001, completed_at - started_at)
-    rps = len(results) / elapsed_seconds
+    rps = aggregate.count / elapsed_seconds
+    avg_latency_ms = (aggregate.latency_sum_ms / aggregate.count) if aggregate.count else 0.0
 
     metrics = {
         "generated_at": _iso_now(),
@@ -138,22 +253,30 @@ def summarize_results(
         "total_requests": config.total_requests,
         "warmup_requests": config.warmup_requests,
         "success_count": success_count,
-        "error_count": max(0, len(results) - success_count),
+        "error_count": max(0, aggregate.count - success_count),
         "success_rate": round(success_rate, 4),
         "elapsed_seconds": round(elapsed_seconds, 3),
         "throughput_rps": round(rps, 2),
-        "avg_latency_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
-        "p50_latency_ms": round(_percentile(latencies, 0.50), 2),
-        "p95_latency_ms": round(_percentile(latencies, 0.95), 2),
-        "p99_latency_ms": round(_percentile(latencies, 0.99), 2),
-        "max_latency_ms": round(max(latencies), 2) if latencies else 0.0,
-        "status_counts": dict(sorted(status_counts.items(), key=lambda item: item[0])),
-        "error_counts": dict(sorted(error_counts.items(), key=lambda item: item[0])),
+        "avg_latency_ms": round(avg_latency_ms, 2),
+        "p50_latency_ms": round(p50_ms, 2),
+        "p95_latency_ms": round(p95_ms, 2),
+        "p99_latency_ms": round(p99_ms, 2),
+        "max_latency_ms": round(aggregate.max_latency_ms, 2),
+        "status_counts": dict(sorted(status_counts.items())),
+        "error_counts": dict(sorted(error_counts.items())),
     }
+    if aggregate.reservoir is not None:
+        metrics["latency_samples_ms"] = [round(value, 2) for value in aggregate.reservoir.samples]
     metrics["capacity_conclusion"] = _capacity_conclusion(metrics, config)
     return metrics
 
 
+def _count_lines(counts: Any) -> list[str]:
+    if isinstance(counts, dict) and counts:
+        return [f"- {key}: {value}" for key, value in counts.items()]
+    return ["- none"]
+
+
 def render_markdown_report(report: dict[str, Any]) -> str:
     capacity = report.get("capacity_conclusion", {})
     status_counts = report.get("status_counts", {})
@@ -179,22 +302,12 @@ def render_markdown_report(report: dict[str, Any]) -> str:
     reasons = capacity.get("reasons", [])
     if isinstance(reasons, list) and reasons:
         lines.append("- reasons:")
-        for reason in reasons:
-            lines.append(f"  - {reason}")
+        lines.extend(f"  - {reason}" for reason in reasons)
 
     lines.extend(["", "## Status Counts", ""])
-    if isinstance(status_counts, dict) and status_counts:
-        for key, value in status_counts.items():
-            lines.append(f"- {key}: {value}")
-    else:
-        lines.append("- none")
-
+    lines.extend(_count_lines(status_counts))
     lines.extend(["", "## Error Counts", ""])
-    if isinstance(error_counts, dict) and error_counts:
-        for key, value in error_counts.items():
-            lines.append(f"- {key}: {value}")
-    else:
-        lines.append("- none")
+    lines.extend(_count_lines(error_counts))
     return "\n".join(lines) + "\n"
 
 
@@ -258,13 +371,11 @@ def _stop_process(proc: subprocess.Popen[str] | None) -> None:
 async def _run_single_request(
     *,
     client: httpx.AsyncClient,
-    url: str,
-    payload: dict[str, Any],
-    headers: dict[str, str],
+    request: httpx.Request,
 ) -> RequestResult:
     started = time.perf_counter()
     try:
-        resp = await client.post(url, json=payload, headers=headers)
+        resp = await client.send(request)
         latency_ms = (time.perf_counter() - started) * 1000.0
         ok = resp.status_code == 200
         if ok:
@@ -287,9 +398,10 @@ async def _run_single_request(
         return RequestResult(ok=False, status_code=0, latency_ms=latency_ms, error=type(exc).__name__)
 
 
-async def _run_burst(config: LoadTestConfig) -> list[RequestResult]:
+async def _run_burst(config: LoadTestConfig) -> ResultAggregator:
     url = config.base_url.rstrip("/") + config.endpoint
-    headers: dict[str, str] = {}
+    body = dumps_json_compact_bytes(config.request_payload)
+    headers: dict[str, str] = {"Content-Type": "application/json"}
     if config.auth_token.strip():
         headers["Authorization"] = f"Bearer {config.auth_token.strip()}"
 
@@ -304,32 +416,48 @@ async def _run_burst(config: LoadTestConfig) -> list[RequestResult]:
         write=config.timeout_seconds,
         pool=config.timeout_seconds,
     )
-    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
-        if config.warmup_requests > 0:
-            for _ in range(config.warmup_requests):
-                await _run_single_request(
-                    client=client,
-                    url=url,
-                    payload=config.request_payload,
-                    headers=headers,
-                )
-
-        semaphore = asyncio.Semaphore(max(1, config.concurrency))
-        rows: list[RequestResult] = []
+    # Each simulated request is independent: never store cookies, and skip the
+    # proxy/netrc environment lookups that trust_env performs.
+    cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    async with httpx.AsyncClient(
+        timeout=timeout,
+        limits=limits,
+        cookies=cookies,
+        trust_env=False,
+        follow_redirects=False,
+    ) as client:
+        # Every request is identical, so URL, headers and body are encoded into
+        # one Request that is re-sent as-is; its byte stream is replayable.
+        request = client.build_request("POST", url, content=body, headers=headers)
+        wave_size = max(1, config.concurrency)
+        # Concurrent warmup opens pooled connections before timing starts, so
+        # the measured burst does not pay for TCP setup. Waves of at most
+        # `concurrency` requests keep large warmups from scheduling every
+        # coroutine at once.
+        for wave_start in range(0, max(0, config.warmup_requests), wave_size):
+            wave = min(wave_size, config.warmup_requests - wave_start)
+            await asyncio.gather(
+                *(_run_single_request(client=client, request=request) for _ in range(wave))
+            )
+
+        total = max(1, config.total_requests)
+        reservoir = (
+            LatencyReservoir(config.latency_samples) if config.latency_samples > 0 else None
+        )
+        aggregate = ResultAggregator(reservoir=reservoir)
+        # Workers share one iterator and one aggregator; the event loop is
+        # single-threaded, so neither needs a lock.
+        pending = iter(range(total))
 
         async def _worker() -> None:
-            async with semaphore:
-                row = await _run_single_request(
-                    client=client,
-                    url=url,
-                    payload=config.request_payload,
-                    headers=headers,
-                )
-                rows.append(row)
+            for _ in pending:
+                row = await _run_single_request(client=client, request=request)
+                aggregate.add(row)
 
-        tasks = [asyncio.create_task(_worker()) for _ in range(max(1, config.total_requests))]
-        await asyncio.gather(*tasks)
-        return rows
+        worker_count = min(total, wave_size)
+        workers = [asyncio.create_task(_worker()) for _ in range(worker_count)]
+        await asyncio.gather(*workers)
+        return aggregate
 
 
 def _default_payload() -> dict[str, Any]:
@@ -370,6 +498,17 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--target-p95-ms", type=float, default=_DEFAULT_TARGET_P95_MS)
     parser.add_argument("--target-concurrency", type=int, default=_DEFAULT_CONCURRENCY)
     parser.add_argument("--report-dir", default=str(_DEFAULT_REPORT_DIR))
+    parser.add_argument(
+        "--latency-samples",
+        type=int,
+        default=0,
+        help="keep a uniform random sample of this many latencies in the JSON report, e.g. 10000",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="print only the capacity summary and report paths instead of the full JSON report",
+    )
     parser.add_argument("--spawn-app", action="store_true", help="spawn local uvicorn app for the test")
     parser.add_argument("--spawn-host", default=_DEFAULT_HOST)
     parser.add_argument("--spawn-port", type=int, default=_DEFAULT_PORT)
@@ -403,16 +542,26 @@ def _build_config(args: argparse.Namespace) -> LoadTestConfig:
         target_success_rate=max(0.0, min(1.0, float(args.target_success_rate))),
         target_p95_ms=max(1.0, float(args.target_p95_ms)),
         target_concurrency=max(1, int(args.target_concurrency)),
+        latency_samples=max(0, int(args.latency_samples)),
     )
 
 
-def _write_reports(*, report: dict[str, Any], report_dir: Path) -> tuple[Path, Path]:
-    report_dir.mkdir(parents=True, exist_ok=True)
+async def _write_reports(
+    *,
+    report: dict[str, Any],
+    report_dir: Path,
+    json_body: str,
+) -> tuple[Path, Path]:
     stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     json_path = report_dir / f"loadtest_{stamp}.json"
     md_path = report_dir / f"loadtest_{stamp}.md"
-    json_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-    md_path.write_text(render_markdown_report(report), encoding="utf-8")
+    md_body = render_markdown_report(report)
+    await asyncio.to_thread(report_dir.mkdir, parents=True, exist_ok=True)
+    # The two files are independent, so their writes overlap.
+    await asyncio.gather(
+        asyncio.to_thread(json_path.write_text, json_body, encoding="utf-8"),
+        asyncio.to_thread(md_path.write_text, md_body, encoding="utf-8"),
+    )
     return json_path, md_path
 
 
@@ -438,7 +587,7 @@ async def _run_main_async(args: argparse.Namespace) -> int:
 
     started = time.perf_counter()
     try:
-        rows = await _run_burst(config)
+        aggregate = await _run_burst(config)
     finally:
         _stop_process(process)
     completed = time.perf_counter()
@@ -447,14 +596,22 @@ async def _run_main_async(args: argparse.Namespace) -> int:
         config=config,
         started_at=started,
         completed_at=completed,
-        results=rows,
+        results=aggregate,
     )
     report["spawn_app"] = bool(args.spawn_app)
     report["spawn_workers"] = max(1, int(args.spawn_workers))
 
-    json_path, md_path = _write_reports(report=report, report_dir=Path(str(args.report_dir)))
+    json_body = (dumps_json_bytes(report) + b"\n").decode("utf-8")
+    json_path, md_path = await _write_reports(
+        report=report,
+        report_dir=Path(str(args.report_dir)),
+        json_body=json_body,
+    )
 
-    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.quiet:
+        print(report["capacity_conclusion"]["summary"])
+    else:
+        sys.stdout.write(json_body)
     print(f"report_json={json_path}")
     print(f"report_md={md_path}")
     return 0 if bool(report.get("capacity_conclusion", {}).get("meets_target")) else 2
@@ -463,7 +620,9 @@ async def _run_main_async(args: argparse.Namespace) -> int:
 def main(argv: list[str] | None = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
-    return asyncio.run(_run_main_async(args))
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(_run_main_async(args))
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ import argparse
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from app.application.context import make_app_context
@@ -110,8 +111,12 @@ def main() -> int:
         "smoke_passed": _smoke_passed(smoke),
     }
     if args.full:
-        eval_report = _run_python_module("app.eval.run_eval")
-        gate_report = _run_python_module("eval.release_gate_runner")
+        # Eval and release gate are independent subprocesses; overlap them.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            eval_future = executor.submit(_run_python_module, "app.eval.run_eval")
+            gate_future = executor.submit(_run_python_module, "eval.release_gate_runner")
+            eval_report = eval_future.result()
+            gate_report = gate_future.result()
         report["eval"] = eval_report
         report["release_gate"] = gate_report
         report["full_passed"] = (
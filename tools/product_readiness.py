@@ -3,34 +3,56 @@
 from __future__ import annotations
 
 import argparse
-import json
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from tools._report_json import dumps_json_bytes, read_json, read_json_stat, write_stdout
 
 _DEFAULT_REPORT_DIR = Path("eval") / "reports"
 _DEFAULT_OUTPUT_JSON = _DEFAULT_REPORT_DIR / "product_readiness_latest.json"
 _DEFAULT_OUTPUT_MD = _DEFAULT_REPORT_DIR / "product_readiness_latest.md"
+# Check rows always come from CheckResult.as_dict, so every key is present.
+_CHECK_ROW_FIELDS = itemgetter("name", "passed", "detail", "report")
+_CHECK_ROW_TEMPLATE = "| {} | {} | {} | {} |"
 
 
 def _now_utc() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    now = time.gmtime()
+    return (
+        f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d}"
+        f"T{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}Z"
+    )
 
 
 def _read_json(path: Path) -> dict[str, Any]:
-    text = path.read_text(encoding="utf-8-sig")
-    payload = json.loads(text)
+    payload = read_json(path)
     if not isinstance(payload, dict):
         raise ValueError(f"{path} must contain a JSON object")
     return payload
 
 
 def _latest_loadtest(report_dir: Path) -> tuple[Path | None, dict[str, Any] | None]:
-    candidates = sorted(report_dir.glob("loadtest_*.json"), key=lambda item: item.stat().st_mtime, reverse=True)
-    for path in candidates:
+    # One directory scan; DirEntry.stat() results also feed the parse cache key,
+    # so each candidate is stat'ed once.
+    candidates: list[tuple[int, str, int]] = []
+    try:
+        with os.scandir(report_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("loadtest_") and entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    candidates.append((stat.st_mtime_ns, entry.path, stat.st_size))
+    except FileNotFoundError:
+        return None, None
+    candidates.sort(reverse=True)
+    for mtime_ns, raw_path, size in candidates:
+        path = Path(raw_path)
         try:
-            payload = _read_json(path)
+            payload = read_json_stat(path, mtime_ns, size)
         except Exception:
             continue
         capacity = payload.get("capacity_conclusion", {})
@@ -39,12 +61,14 @@ def _latest_loadtest(report_dir: Path) -> tuple[Path | None, dict[str, Any] | No
     return None, None
 
 
-@dataclass(frozen=True)
 class CheckResult:
-    name: str
-    passed: bool
-    detail: str
-    report: str
+    __slots__ = ("name", "passed", "detail", "report")
+
+    def __init__(self, name: str, passed: bool, detail: str, report: str) -> None:
+        self.name = name
+        self.passed = passed
+        self.detail = detail
+        self.report = report
 
     def as_dict(self) -> dict[str, Any]:
         return {
@@ -91,11 +115,17 @@ def _check_loadtest(report_dir: Path) -> CheckResult:
     return CheckResult("capacity_500_concurrency", passed, detail, str(path))
 
 
-def _check_slo(report_dir: Path, *, file_name: str, check_name: str) -> CheckResult:
+def _check_generic(
+    report_dir: Path,
+    *,
+    file_name: str,
+    check_name: str,
+    include_metrics: bool,
+) -> CheckResult:
     path = report_dir / file_name
     payload = _read_json(path)
     passed = bool(payload.get("passed"))
-    metrics = payload.get("metrics", {})
+    metrics = payload.get("metrics", {}) if include_metrics else None
     if isinstance(metrics, dict):
         p95_ms = float(metrics.get("p95_latency_ms", 0.0))
         success_rate = float(metrics.get("success_rate", 0.0))
@@ -105,14 +135,6 @@ def _check_slo(report_dir: Path, *, file_name: str, check_name: str) -> CheckRes
     return CheckResult(check_name, passed, detail, str(path))
 
 
-def _check_simple_bool(report_dir: Path, *, file_name: str, check_name: str) -> CheckResult:
-    path = report_dir / file_name
-    payload = _read_json(path)
-    passed = bool(payload.get("passed"))
-    detail = f"passed={passed}"
-    return CheckResult(check_name, passed, detail, str(path))
-
-
 def _check_observability_stack(report_dir: Path) -> CheckResult:
     path = report_dir / "observability_stack_latest.json"
     payload = _read_json(path)
@@ -150,59 +172,88 @@ def _render_markdown(report: dict[str, Any]) -> str:
         "| check | passed | detail | report |",
         "| --- | --- | --- | --- |",
     ]
-    for row in report.get("checks", []):
-        lines.append(
-            f"| {row.get('name')} | {row.get('passed')} | {row.get('detail')} | {row.get('report')} |"
-        )
+    lines.extend(
+        _CHECK_ROW_TEMPLATE.format(*_CHECK_ROW_FIELDS(row)) for row in report.get("checks", [])
+    )
     return "\n".join(lines) + "\n"
 
 
-def build_readiness_report(report_dir: Path) -> dict[str, Any]:
-    checks = [
-        _check_product_acceptance(report_dir),
-        _check_frontend_e2e(report_dir),
-        _check_loadtest(report_dir),
-        _check_slo(report_dir, file_name="slo_latest.json", check_name="slo_degraded"),
-        _check_slo(report_dir, file_name="slo_realtime_latest.json", check_name="slo_realtime"),
-        _check_simple_bool(
-            report_dir,
-            file_name="dependency_fault_drill_latest.json",
-            check_name="dependency_fault_drill",
-        ),
-        _check_simple_bool(
-            report_dir,
-            file_name="persistence_drill_latest.json",
-            check_name="persistence_drill",
-        ),
-        _check_observability_stack(report_dir),
-        _check_remote_ci(report_dir),
-    ]
+# Reports whose verdict is a top-level "passed" flag: (file, check name, include metrics).
+_CHECK_SPECS: tuple[tuple[str, str, bool], ...] = (
+    ("slo_latest.json", "slo_degraded", True),
+    ("slo_realtime_latest.json", "slo_realtime", True),
+    ("dependency_fault_drill_latest.json", "dependency_fault_drill", False),
+    ("persistence_drill_latest.json", "persistence_drill", False),
+)
+_CHECKS: tuple[Callable[[Path], CheckResult], ...] = (
+    _check_product_acceptance,
+    _check_frontend_e2e,
+    _check_loadtest,
+    *(
+        partial(
+            _check_generic,
+            file_name=file_name,
+            check_name=check_name,
+            include_metrics=include_metrics,
+        )
+        for file_name, check_name, include_metrics in _CHECK_SPECS
+    ),
+    _check_observability_stack,
+    _check_remote_ci,
+)
+
+
+def build_readiness_report(report_dir: Path, *, fast_fail: bool = False) -> dict[str, Any]:
+    if fast_fail:
+        # Run in order and stop at the first failure; later reports are never read.
+        checks: list[CheckResult] = []
+        for check in _CHECKS:
+            checks.append(check(report_dir))
+            if not checks[-1].passed:
+                break
+    else:
+        # Checks read independent report files, so their I/O overlaps; map keeps order.
+        with ThreadPoolExecutor(max_workers=len(_CHECKS)) as executor:
+            checks = list(executor.map(lambda check: check(report_dir), _CHECKS))
     rows = [item.as_dict() for item in checks]
-    return {
+    report: dict[str, Any] = {
         "generated_at": _now_utc(),
         "overall_passed": all(item.passed for item in checks),
         "checks": rows,
     }
+    if fast_fail:
+        report["skipped_checks"] = len(_CHECKS) - len(checks)
+    return report
 
 
-def main(argv: list[str] | None = None) -> int:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Aggregate product readiness evidence reports")
     parser.add_argument("--report-dir", default=str(_DEFAULT_REPORT_DIR))
     parser.add_argument("--output-json", default=str(_DEFAULT_OUTPUT_JSON))
     parser.add_argument("--output-md", default=str(_DEFAULT_OUTPUT_MD))
-    args = parser.parse_args(argv)
+    parser.add_argument(
+        "--fast-fail",
+        action="store_true",
+        help="Stop at the first failing check and skip the remaining reports",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
 
     report_dir = Path(str(args.report_dir))
-    report = build_readiness_report(report_dir)
-    rendered = json.dumps(report, ensure_ascii=False, indent=2) + "\n"
+    report = build_readiness_report(report_dir, fast_fail=bool(args.fast_fail))
+    rendered = dumps_json_bytes(report) + b"\n"
 
     output_json = Path(str(args.output_json))
     output_md = Path(str(args.output_md))
     output_json.parent.mkdir(parents=True, exist_ok=True)
-    output_json.write_text(rendered, encoding="utf-8")
+    output_json.write_text(rendered.decode("utf-8"), encoding="utf-8")
     output_md.write_text(_render_markdown(report), encoding="utf-8")
 
-    print(json.dumps(report, ensure_ascii=False, indent=2))
+    write_stdout(rendered)
     return 0 if bool(report.get("overall_passed")) else 1
 
 
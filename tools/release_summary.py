@@ -6,11 +6,12 @@ Aggregates latest eval + release gate reports into one compact status view.
 from __future__ import annotations
 
 import argparse
-import json
 import time
 from pathlib import Path
 from typing import Any
 
+from tools._report_json import dumps_json_bytes, read_json, write_stdout
+
 _DEFAULT_GATE_REPORT = Path("eval") / "reports" / "release_gate_latest.json"
 _DEFAULT_EVAL_REPORT_DIR = Path("app") / "eval" / "reports"
 _TRACKED_GATE_METRICS = (
@@ -33,21 +34,33 @@ _TRACKED_GATE_METRICS = (
 
 
 def _read_json(path: Path) -> dict[str, Any]:
-    text = path.read_text(encoding="utf-8")
-    payload = json.loads(text)
+    payload = read_json(path)
     if not isinstance(payload, dict):
         raise ValueError(f"report payload must be a JSON object: {path}")
     return payload
 
 
+def _now_local() -> str:
+    now = time.localtime()
+    return (
+        f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d}"
+        f"T{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+    )
+
+
 def _coerce_float(value: Any) -> float | None:
     if isinstance(value, (int, float)):
         return float(value)
     return None
 
 
-def _percentile(values: list[float], ratio: float) -> float:
-    ordered = sorted(values)
+def _rounded_metric(value: Any) -> float | None:
+    if isinstance(value, (int, float)):
+        return round(float(value), 4)
+    return None
+
+
+def _percentile_sorted(ordered: list[float], ratio: float) -> float:
     if not ordered:
         return 0.0
     safe_ratio = max(0.0, min(1.0, ratio))
@@ -70,18 +83,20 @@ def _confidence_from_rows(case_rows: Any) -> dict[str, Any]:
     if not scores:
         return {"samples": 0, "mean": None, "p50": None, "p90": None}
 
+    # Sort once in place; both percentiles index into the same ordering.
+    scores.sort()
     mean = sum(scores) / len(scores)
     return {
         "samples": len(scores),
         "mean": round(mean, 4),
-        "p50": round(_percentile(scores, 0.5), 4),
-        "p90": round(_percentile(scores, 0.9), 4),
+        "p50": round(_percentile_sorted(scores, 0.5), 4),
+        "p90": round(_percentile_sorted(scores, 0.9), 4),
     }
 
 
 def load_latest_eval_report(eval_report_dir: Path) -> tuple[Path, dict[str, Any]] | None:
-    candidates = sorted(eval_report_dir.glob("eval_*.json"))
-    target: Path | None = candidates[-1] if candidates else None
+    # Same Path ordering as sorted(...)[-1], in one linear pass.
+    target: Path | None = max(eval_report_dir.glob("eval_*.json"), default=None)
     if target is None:
         latest = eval_report_dir / "latest.json"
         if latest.exists():
@@ -101,10 +116,7 @@ def build_summary(
     metrics = release_gate_report.get("metrics", {})
     metrics = metrics if isinstance(metrics, dict) else {}
 
-    tracked_metrics: dict[str, float | None] = {}
-    for key in _TRACKED_GATE_METRICS:
-        value = _coerce_float(metrics.get(key))
-        tracked_metrics[key] = round(value, 4) if value is not None else None
+    tracked_metrics = {key: _rounded_metric(metrics.get(key)) for key in _TRACKED_GATE_METRICS}
 
     confidence_samples = int(metrics.get("confidence_samples", 0)) if isinstance(
         metrics.get("confidence_samples"), (int, float)
@@ -133,7 +145,7 @@ def build_summary(
         }
 
     return {
-        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "generated_at": _now_local(),
         "release_gate_passed": bool(release_gate_report.get("passed")),
         "release_gate_report": str(release_gate_path),
         "eval_report": str(eval_path) if eval_path is not None else None,
@@ -216,13 +228,13 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     if args.format == "json":
-        rendered = json.dumps(summary, ensure_ascii=False, indent=2)
+        rendered = dumps_json_bytes(summary) + b"\n"
     else:
-        rendered = render_summary_text(summary)
-    print(rendered)
+        rendered = (render_summary_text(summary) + "\n").encode("utf-8")
+    write_stdout(rendered)
 
     if args.output:
-        Path(args.output).write_text(rendered + "\n", encoding="utf-8")
+        Path(args.output).write_text(rendered.decode("utf-8"), encoding="utf-8")
 
     if args.fail_on_gate_fail and not summary.get("release_gate_passed", False):
         return 1
@@ -3,39 +3,54 @@
 from __future__ import annotations
 
 import argparse
-import json
+import atexit
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
-from urllib import error, request
 
+import httpx
 from app.observability.slo import evaluate_slo_objectives, resolve_slo_objectives
 
+from tools._report_json import dumps_json_bytes, loads_json, read_json, write_stdout
+
 _DEFAULT_OBJECTIVES_PATH = Path("deploy") / "observability" / "slo_objectives.json"
+_FETCH_CONNECT_RETRIES = 2
+_METRICS_HEADERS = {"Accept": "application/json"}
+
+_metrics_client: httpx.Client | None = None
 
 
-def _load_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+def _get_metrics_client() -> httpx.Client:
+    # One pooled client per process keeps connections warm when main() is called repeatedly.
+    global _metrics_client
+    if _metrics_client is None:
+        # httpx advertises gzip/deflate and decodes compressed bodies transparently;
+        # transport retries only cover failed connects, so a GET is never replayed.
+        _metrics_client = httpx.Client(
+            transport=httpx.HTTPTransport(retries=_FETCH_CONNECT_RETRIES),
+            follow_redirects=True,
+        )
+        atexit.register(_metrics_client.close)
+    return _metrics_client
 
 
 def _fetch_metrics_snapshot(base_url: str, token: str = "", timeout: int = 10) -> dict[str, Any]:
     url = base_url.rstrip("/") + "/metrics"
-    headers: dict[str, str] = {"Accept": "application/json"}
+    headers = _METRICS_HEADERS
     if token.strip():
-        headers["Authorization"] = f"Bearer {token.strip()}"
-    req = request.Request(url=url, headers=headers, method="GET")
-    try:
-        with request.urlopen(req, timeout=timeout) as resp:
-            payload = resp.read().decode("utf-8")
-            parsed = json.loads(payload)
-            if not isinstance(parsed, dict):
-                raise ValueError("metrics response must be JSON object")
-            return parsed
-    except error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"metrics request failed: status={exc.code} body={body}") from exc
+        headers = {**_METRICS_HEADERS, "Authorization": f"Bearer {token.strip()}"}
+    resp = _get_metrics_client().get(url, headers=headers, timeout=timeout)
+    if resp.is_error:
+        raise RuntimeError(f"metrics request failed: status={resp.status_code} body={resp.text}")
+    parsed = loads_json(resp.content)
+    if not isinstance(parsed, dict):
+        raise ValueError("metrics response must be JSON object")
+    return parsed
 
 
+@lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
+    # Parsers are reusable, so callers that invoke main() in a loop build it once.
     parser = argparse.ArgumentParser(description="Evaluate SLO objectives from runtime metrics snapshot")
     parser.add_argument("--base-url", default="", help="Fetch metrics from <base-url>/metrics")
     parser.add_argument("--metrics-json", default="", help="Read metrics snapshot from local JSON file")
@@ -55,12 +70,12 @@ def _build_parser() -> argparse.ArgumentParser:
 def main(argv: list[str] | None = None) -> int:
     args = _build_parser().parse_args(argv)
     objectives_path = Path(str(args.objectives))
-    objectives_config = _load_json(objectives_path)
+    objectives_config = read_json(objectives_path)
 
     metrics_json = str(args.metrics_json).strip()
     base_url = str(args.base_url).strip()
     if metrics_json:
-        snapshot = _load_json(Path(metrics_json))
+        snapshot = read_json(Path(metrics_json))
     elif base_url:
         snapshot = _fetch_metrics_snapshot(base_url, token=str(args.auth_token), timeout=int(args.timeout))
     else:
@@ -77,10 +92,10 @@ def main(argv: list[str] | None = None) -> int:
     report = evaluate_slo_objectives(snapshot, objectives)
     report["profile"] = selected_profile
     report["objectives_file"] = str(objectives_path)
-    rendered = json.dumps(report, ensure_ascii=False, indent=2)
-    print(rendered)
+    rendered = dumps_json_bytes(report) + b"\n"
+    write_stdout(rendered)
     if str(args.output).strip():
-        Path(str(args.output)).write_text(rendered + "\n", encoding="utf-8")
+        Path(str(args.output)).write_text(rendered.decode("utf-8"), encoding="utf-8")
     return 0 if bool(report.get("passed")) else 1
 
 